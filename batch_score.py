@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Batch scoring for Guess-My-Word, for programs that score many guesses at once (e.g. a bot playing the game or
+generating data for analysis). The interactive game in guess_my_word.py does not need this module or NumPy.
+
+Scores are packed the same way as guess_my_word.score_guess_packed(), so they can be passed straight to
+is_correct_packed(), format_packed_score() and unpack_score().
+
+If Numba is installed, score_letters() scores single encoded guesses with compiled code; without it the same
+function runs as plain Python.
+"""
+import numpy as np
+
+from guess_my_word import EXACT, MISPLACED, WORD_LENGTH
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        return lambda function: function
+
+ALPHABET_SIZE = 26
+
+
+def encode_words(words):
+    """
+    Converts words into an array of letter codes, one row per word, for use with score_guesses().
+
+    Args:
+        words: an iterable of lowercase 5-letter words.
+
+    Returns:
+        a (number of words, 5) uint8 array where 'a' = 0, ..., 'z' = 25.
+
+    Raises:
+        ValueError: if any word contains anything other than lowercase letters a-z.
+
+    Examples:
+    >>> encode_words(['aback', 'zonal']).tolist()
+    [[0, 1, 0, 2, 10], [25, 14, 13, 0, 11]]
+    >>> encode_words(['Hello'])
+    Traceback (most recent call last):
+    ...
+    ValueError: words must only contain lowercase letters a-z
+    """
+    words = ''.join(words)
+    if not words.isascii():
+        raise ValueError('words must only contain lowercase letters a-z')
+
+    letters = np.frombuffer(words.encode('ascii'), dtype=np.uint8) - ord('a')
+    # anything outside a-z wraps around to a code past 'z'; score_letters() does not bounds-check its counts
+    if (letters >= ALPHABET_SIZE).any():
+        raise ValueError('words must only contain lowercase letters a-z')
+
+    return letters.reshape(-1, WORD_LENGTH)
+
+
+def score_guesses(guesses, target_word):
+    """
+    Scores every guess against the target word at once, giving the same scores as score_guess_packed().
+
+    Args:
+        guesses: a (number of guesses, 5) uint8 array of letter codes, as returned by encode_words().
+        target_word: a (5,) uint8 array of letter codes for the target word.
+
+    Returns:
+        a uint16 array with the packed score of each guess.
+
+    Examples:
+    >>> from guess_my_word import score_guess_packed
+    >>> guesses = ['hello', 'gauge', 'melee', 'array', 'train', 'spams']
+    >>> score_guesses(encode_words(guesses), encode_words(['range'])[0]).tolist() == [
+    ...     score_guess_packed(guess, 'range') for guess in guesses]
+    True
+    >>> score_guesses(encode_words(guesses), encode_words(['erect'])[0]).tolist() == [
+    ...     score_guess_packed(guess, 'erect') for guess in guesses]
+    True
+    """
+    rows = np.arange(len(guesses))
+    exact = guesses == target_word
+
+    # counts of target word letters not matched exactly, one row of letter counts per guess
+    remaining_letters = np.zeros((len(guesses), ALPHABET_SIZE), dtype=np.uint8)
+    np.add.at(remaining_letters, (rows[:, np.newaxis], target_word), ~exact)
+
+    score = np.zeros(len(guesses), dtype=np.uint16)
+    for position in range(WORD_LENGTH):
+        shift = 2 * (WORD_LENGTH - 1 - position)
+        letters = guesses[:, position]
+
+        # identifies misplaced scores, using up target letters from left to right like score_guess_packed()
+        misplaced = ~exact[:, position] & (remaining_letters[rows, letters] > 0)
+        remaining_letters[rows, letters] -= misplaced
+
+        score |= np.where(exact[:, position], EXACT, np.where(misplaced, MISPLACED, 0)).astype(np.uint16) << shift
+
+    return score
+
+
+@njit(cache=True)
+def score_letters(guess, target_word):
+    """
+    Scores one encoded guess against one encoded target word, giving the same score as score_guess_packed().
+
+    Meant for solvers that score one pair at a time many times over: encode the word list once with
+    encode_words() and pass its rows to this function in the loop. With Numba installed this is compiled (the first
+    call pays for compiling, which Numba caches on disk for later runs); without Numba it runs as plain Python on
+    NumPy arrays, which is slower than score_guess_packed() on strings.
+
+    Args:
+        guess: a (5,) uint8 array of letter codes for the guess, e.g. a row from encode_words().
+        target_word: a (5,) uint8 array of letter codes for the target word.
+
+    Returns:
+        a uint16 holding the score of each letter in 2 bits, the first letter in the highest bits.
+
+    Examples:
+    >>> from guess_my_word import score_guess_packed
+    >>> guess, target_word = encode_words(['train', 'tenor'])
+    >>> int(score_letters(guess, target_word)) == score_guess_packed('train', 'tenor')
+    True
+    >>> guess, target_word = encode_words(['melee', 'erect'])
+    >>> int(score_letters(guess, target_word)) == score_guess_packed('melee', 'erect')
+    True
+    """
+    remaining_letters = np.zeros(ALPHABET_SIZE, dtype=np.uint8)
+    score = 0
+
+    # identifies exact scores
+    for position in range(WORD_LENGTH):
+        if guess[position] == target_word[position]:
+            score |= EXACT << 2 * (WORD_LENGTH - 1 - position)
+        else:
+            remaining_letters[target_word[position]] += 1
+
+    # identifies misplaced scores; anything left over stays a miss
+    for position in range(WORD_LENGTH):
+        letter = guess[position]
+        if letter != target_word[position] and remaining_letters[letter] > 0:
+            score |= MISPLACED << 2 * (WORD_LENGTH - 1 - position)
+            remaining_letters[letter] -= 1
+
+    return np.uint16(score)
+
+
+if __name__ == '__main__':
+    import doctest
+    doctest.testmod(verbose=True)
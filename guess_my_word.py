@@ -9,8 +9,11 @@ Author: Joanne Helen Mana
 Company: words-are-us
 Copyright: November, 2022
 """
+import functools
+import mmap
 import random
 import os
+import sys
 
 MISS = 0  # _-.: letter not found
 MISPLACED = 1  # O, ?: letter in wrong place
@@ -23,6 +26,83 @@ ALL_WORDS = 'word-bank/all_words.txt'
 TARGET_WORDS = 'word-bank/target_words.txt'
 MISS_LETTERS_FILE = 'miss_letters.txt'
 
+# a score can be packed into a single int, 2 bits per letter with the first letter in the highest bits
+_SCORE_SHIFTS = tuple(2 * position for position in reversed(range(WORD_LENGTH)))
+CORRECT_SCORE = sum(EXACT << shift for shift in _SCORE_SHIFTS)
+
+_HELP_TEXT = ('Guess-My-Word HELP:\nThe goal in Guess-My-Word is to guess a 5-letter English word of the day in 6 '
+              'attempts or less.\nFor each attempt, you must enter a valid word. The attempt is not lost if the '
+              'guess is invalid - the game continues to ask for a guess until a valid guess is provided.\n'
+              'Both the target word and the guess can contain repeated letters. You must enter your guess and press '
+              'ENTER.\nThe system returns a score on your guess, which displays if the letters in the guess are '
+              'present in the word of the day.\n\nX = exact \n0 = misplaced \n_ = miss\n\nIf the guess is not '
+              'correct, the game continues to ask for a guess until the attempts are exhausted (game is lost)\nor '
+              'until you correctly guess the word of the day (game is won) within the provided attempts.\n')
+
+# translates score digits into the symbols shown to the user
+_SCORE_TABLE = str.maketrans({str(MISS): '_', str(MISPLACED): '0', str(EXACT): 'X'})
+
+
+def pack_score(score):
+    """
+    Packs a score tuple into a single int, 2 bits per letter with the first letter in the highest bits.
+
+    Args:
+        score: a 5-element tuple containing the score for user's guess against the target word.
+
+    Examples:
+    >>> pack_score((0, 0, 0, 0, 0))
+    0
+    >>> pack_score((1, 0, 0, 2, 1))
+    265
+    >>> pack_score((2, 2, 2, 2, 2)) == CORRECT_SCORE
+    True
+    """
+    packed_score = 0
+    for value in score:
+        packed_score = packed_score << 2 | value
+
+    return packed_score
+
+
+def unpack_score(packed_score):
+    """
+    Unpacks a score packed by pack_score() or score_guess_packed() back into a tuple.
+
+    Args:
+        packed_score: an int holding the score of each letter in 2 bits, the first letter in the highest bits.
+
+    Examples:
+    >>> unpack_score(265)
+    (1, 0, 0, 2, 1)
+    >>> unpack_score(CORRECT_SCORE)
+    (2, 2, 2, 2, 2)
+    """
+    score = tuple(packed_score >> shift & 3 for shift in _SCORE_SHIFTS)
+
+    return score
+
+
+def _build_score_display(score):
+    """
+    Builds the line of score symbols shown under a guess, e.g. '0 _ _ X 0'.
+
+    Args:
+        score: the packed score for user's guess against the target word, as returned by score_guess_packed().
+    """
+    score_string = ' '.join(map(str, unpack_score(score)))
+
+    return score_string.translate(_SCORE_TABLE)
+
+
+# the score line for every possible packed score, so format_packed_score() only has to look it up
+_SCORE_DISPLAY = tuple(_build_score_display(score) for score in range(1 << 2 * WORD_LENGTH))
+
+
+# letters entered by the user that are not in the word of the day, for the current game, one bit per letter
+# ('A' = bit 0, ..., 'Z' = bit 25)
+_miss_letters_mask = 0
+
 
 def play():
     """Code that controls the interactive game play."""
@@ -38,11 +118,11 @@ def play():
         guess = ask_for_guess(valid_words, user_name)
         attempt += 1
 
-        score = score_guess(guess, word_of_the_day)
-        print(format_score(guess, score))
+        score = score_guess_packed(guess, word_of_the_day)
+        print(format_packed_score(guess, score))
         print(track_miss_letters(guess, word_of_the_day))
 
-        if is_correct(score) is True:
+        if is_correct_packed(score) is True:
             print(f'\nWell done, {user_name}, you won!\nWord of the day: {word_of_the_day}\n')
 
         else:
@@ -70,36 +150,109 @@ def is_correct(score):
     >>> is_correct((2,2,2,2,2))
     True
     """
-    if score == (2, 2, 2, 2, 2):
-        return True
-    else:
-        return False
+    return score == (EXACT,) * WORD_LENGTH
+
+
+def is_correct_packed(score):
+    """
+    Checks if a packed score is entirely correct and returns True if it is. Used by play(), so the score of each
+    guess never has to be unpacked into a tuple.
+
+    Args:
+        score: the packed score for user's guess against the target word, as returned by score_guess_packed().
+
+    Tests:
+    >>> is_correct_packed(pack_score((2,2,2,2,1)))
+    False
+    >>> is_correct_packed(pack_score((2,2,2,2,2)))
+    True
+    """
+    return score == CORRECT_SCORE
 
 
+@functools.lru_cache(maxsize=None)
+def read_words(file_path):
+    """
+    Reads a word-bank file once and keeps its words in memory for the rest of the run. Words are interned, so
+    an interned guess matches its word by identity rather than by comparing characters.
+
+    Args:
+        file_path: the path to a file containing one word per line.
+
+    Returns:
+        a tuple of the words in the file, in file order.
+
+    Tests:
+    >>> read_words(TARGET_WORDS)[:3]
+    ('aback', 'abase', 'abate')
+    >>> read_words(TARGET_WORDS) is read_words(TARGET_WORDS)
+    True
+    >>> import tempfile
+    >>> with tempfile.TemporaryDirectory() as directory:
+    ...     empty_file_path = os.path.join(directory, 'empty.txt')
+    ...     open(empty_file_path, 'w').close()
+    ...     read_words.__wrapped__(empty_file_path)  # bypasses the cache, so the temporary path is not kept
+    ()
+    """
+    with open(file_path, 'rb') as file:
+        # an empty file cannot be mapped, and has no words anyway
+        if os.fstat(file.fileno()).st_size == 0:
+            return ()
+
+        # maps the file instead of reading it through a text file object, and decodes it in one pass straight
+        # from the mapped memory (the word banks are plain ASCII)
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+            words = tuple(map(sys.intern, str(mapped_file, 'ascii').split()))
+
+    return words
+
+
+@functools.lru_cache(maxsize=None)
 def get_valid_words(file_path=ALL_WORDS):
     """
-    Returns a list containing all valid words.
+    Returns a set containing all valid words, so checking a guess against it is a constant-time lookup.
 
     Args:
         file_path: a file containing all 5-letter English words valid accepted as guess by game.
 
     Tests:
-    >>> get_valid_words()[0]
-    'aahed'
-    >>> get_valid_words()[-1]
-    'zymic'
-    >>> get_valid_words()[10:15]
-    ['abamp', 'aband', 'abase', 'abash', 'abask']
+    >>> 'aahed' in get_valid_words()
+    True
+    >>> 'zzzzz' in get_valid_words()
+    False
+    >>> len(get_valid_words()) == len(_valid_words_indexed())
+    True
     """
-    with open(file_path) as file:
-        valid_words = file.read().split()
+    valid_words = frozenset(read_words(file_path))
 
     return valid_words
 
 
+def _valid_words_indexed(file_path=ALL_WORDS):
+    """
+    Returns all valid words in file order, for positional access without sorting the set from get_valid_words().
+    Both share the words cached by read_words(), so the file is still only read and split once.
+
+    Args:
+        file_path: a file containing all 5-letter English words valid accepted as guess by game.
+
+    Tests:
+    >>> _valid_words_indexed()[0]
+    'aahed'
+    >>> _valid_words_indexed()[-1]
+    'zymic'
+    >>> _valid_words_indexed()[10:15]
+    ('abamp', 'aband', 'abase', 'abash', 'abask')
+    """
+    return read_words(file_path)
+
+
 def get_target_word(file_path=TARGET_WORDS):
     """Picks a random word from a file of valid words.
 
+    The file is only read on the first call (see read_words()); after that, picking a word is a single
+    random.choice() on the cached tuple.
+
     Args:
         file_path: the path to the file containing all posible target words.
     Returns:
@@ -114,9 +267,7 @@ def get_target_word(file_path=TARGET_WORDS):
     >>> get_target_word()
     'first'
     """
-    with open(file_path) as file:
-        words = file.read().split()
-    target_word = random.choice(words)
+    target_word = random.choice(read_words(file_path))
 
     return target_word
 
@@ -128,23 +279,28 @@ def ask_for_guess(valid_words, user_name):
     Returns:
         str: the guess entered by the user. Ensures guess is a valid word of correct length in lowercase.
     """
+    prompt = f'Enter your guess, {user_name}:\n'
+    error_message = f'Error. Please enter a 5-letter valid English word, {user_name}.\n'
+
     while True:
-        guess = input(f'Enter your guess, {user_name}:\n')
-        guess = guess.lower().strip()
-        if guess == 'h':
+        guess = input(prompt)
+        # strips before lowering and checks the length before the word lookup, so long input is never lowered or hashed
+        guess = guess.strip()
+        if guess in ('h', 'H'):
             game_help()
-        elif guess not in valid_words:
-            print(f'Error. Please enter a 5-letter valid English word, {user_name}.\n')
         elif len(guess) != WORD_LENGTH:
-            print(f'Error. Please enter a 5-letter valid English word, {user_name}.\n')
+            print(error_message)
         else:
-            return guess
+            guess = sys.intern(guess.lower())
+            if guess in valid_words:
+                return guess
+            print(error_message)
 
 
 def score_guess(guess, target_word):
     """
     Given two strings of equal length, returns a tuple of ints representing the score of the guess
-    against the target word.
+    against the target word. Both strings must be ASCII, as the words in the word bank are.
 
     Args:
         guess: the word entered by user as guess.
@@ -153,6 +309,9 @@ def score_guess(guess, target_word):
     Returns:
         a tuple of ints where the numbers represent a score: 0 = miss, 1 = misplaced, 2 = exact.
 
+    Raises:
+        ValueError: if either string contains a non-ASCII character.
+
     Examples:
     >>> score_guess('hello', 'hello')
     (2, 2, 2, 2, 2)
@@ -168,59 +327,86 @@ def score_guess(guess, target_word):
     (0, 0, 2, 2, 2)
     >>> score_guess('train', 'tenor')
     (2, 1, 0, 0, 1)
+    >>> score_guess('Zebra', 'atone')
+    (0, 1, 0, 0, 1)
+    >>> score_guess('crème', 'cream')
+    Traceback (most recent call last):
+    ...
+    ValueError: guess and target word must be ASCII: 'crème', 'cream'
     """
-    # initialisers
-    temporary_score = [' '] * 5
-    score_list = []
+    # the letter counts in score_guess_packed() have one slot per ASCII character
+    if not (guess.isascii() and target_word.isascii()):
+        raise ValueError(f'guess and target word must be ASCII: {guess!r}, {target_word!r}')
+
+    score = [MISS] * WORD_LENGTH
+    # counts of target word letters not matched exactly, indexed by ASCII code
+    remaining_letters = bytearray(128)
+
+    # identifies exact scores
+    for position in range(WORD_LENGTH):
+        if guess[position] == target_word[position]:
+            score[position] = EXACT
+        else:
+            remaining_letters[ord(target_word[position])] += 1
+
+    # identifies misplaced scores; anything left over stays a miss
+    for position in range(WORD_LENGTH):
+        if score[position] == MISS:
+            letter_code = ord(guess[position])
+            if remaining_letters[letter_code]:
+                score[position] = MISPLACED
+                remaining_letters[letter_code] -= 1
 
-    # key for letter checked in guess
-    checked = '-'
+    score = tuple(score)
+
+    return score
 
-    guess_letters = list(guess)
-    target_word_letters = list(target_word)
+
+def score_guess_packed(guess, target_word):
+    """
+    Scores the guess against the target word like score_guess(), but returns the score packed into a single int
+    (see pack_score()) so no tuple is built on every guess.
+
+    Args:
+        guess: the word entered by user as guess.
+        target_word: the word of the day chosen at random by the program from a list of valid words.
+
+    Returns:
+        an int holding the score of each letter in 2 bits, the first letter in the highest bits.
+
+    Examples:
+    >>> score_guess_packed('hello', 'hello') == CORRECT_SCORE
+    True
+    >>> score_guess_packed('gauge', 'range') == pack_score((0, 2, 0, 2, 2))
+    True
+    """
+    score = 0  # every letter starts as a miss
+    # counts of target word letters not matched exactly, indexed by ASCII code
+    remaining_letters = bytearray(128)
+    # guess letters not matched exactly, with the shift of their place in the score
+    unmatched_letters = []
 
     # identifies exact scores
-    for position, letter in enumerate(guess):
-        if letter == target_word[position]:
-            temporary_score[position] = 'X'  # 'X': exact
-            guess_letters[position] = checked
-            target_word_letters.remove(letter)
-
-    for position, letter in enumerate(guess_letters):
-        # rules out repeated and/or already checked letters
-        if letter != checked:
-            # identifies misplaced scores
-            if letter in target_word_letters:
-                temporary_score[position] = '0'  # '0': misplaced
-                guess_letters[position] = checked
-                target_word_letters.remove(letter)
-            # identifies miss scores
-            else:
-                temporary_score[position] = '_'  # '_': miss
-
-    # formats score into required convention
-    for character in temporary_score:
-        if character == 'X':
-            score_list.append(2)  # 2: exact
-        elif character == '0':
-            score_list.append(1)  # 1: misplaced
-        elif character == '_':
-            score_list.append(0)  # 0: miss
-    score = tuple(score_list)
+    for guess_letter, target_letter, shift in zip(guess, target_word, _SCORE_SHIFTS):
+        if guess_letter == target_letter:
+            score |= EXACT << shift
+        else:
+            remaining_letters[ord(target_letter)] += 1
+            unmatched_letters.append((guess_letter, shift))
+
+    # identifies misplaced scores; anything left over stays a miss
+    for guess_letter, shift in unmatched_letters:
+        letter_code = ord(guess_letter)
+        if remaining_letters[letter_code]:
+            score |= MISPLACED << shift
+            remaining_letters[letter_code] -= 1
 
     return score
 
 
 def game_help():
     """Provides help for the game"""
-    print('Guess-My-Word HELP:\nThe goal in Guess-My-Word is to guess a 5-letter English word of the day in 6 '
-          'attempts or less.\nFor each attempt, you must enter a valid word. The attempt is not lost if the '
-          'guess is invalid - the game continues to ask for a guess until a valid guess is provided.\n'
-          'Both the target word and the guess can contain repeated letters. You must enter your guess and press '
-          'ENTER.\nThe system returns a score on your guess, which displays if the letters in the guess are '
-          'present in the word of the day.\n\nX = exact \n0 = misplaced \n_ = miss\n\nIf the guess is not '
-          'correct, the game continues to ask for a guess until the attempts are exhausted (game is lost)\nor '
-          'until you correctly guess the word of the day (game is won) within the provided attempts.\n')
+    print(_HELP_TEXT)
 
 
 def format_score(guess, score):
@@ -252,26 +438,34 @@ def format_score(guess, score):
     H E L L O
     X X X X X
     """
-    score_format = ()
-    miss = ('_',)
-    misplaced = ('0',)
-    exact = ('X',)
+    output = format_packed_score(guess, pack_score(score))
+
+    return output
+
+
+def format_packed_score(guess, score):
+    """
+    Formats a guess with a given packed score as output to the terminal, like format_score(). Used by play(), so
+    the score of each guess never has to be unpacked into a tuple.
+
+    Args:
+        guess: the word entered by user as guess.
+        score: the packed score for user's guess against the target word, as returned by score_guess_packed().
+
+    Returns:
+        an easily readable version of the user's guess and its score.
 
+    Examples:
+    >>> print(format_packed_score('hello', pack_score((1,0,0,2,1))))
+    H E L L O
+    0 _ _ X 0
+    """
     # formats guess
     upper_guess = guess.upper()
     output_guess = ' '.join(upper_guess)
 
     # formats score
-    score_string = ' '.join(str(value) for value in score)
-    for value in score_string:
-        if value == '0':
-            score_format += miss
-        elif value == '1':
-            score_format += misplaced
-        elif value == '2':
-            score_format += exact
-
-    output_score = ' '.join(str(value) for value in score_format)
+    output_score = _SCORE_DISPLAY[score]
     output = output_guess + '\n' + output_score
 
     return output
@@ -284,7 +478,7 @@ def track_miss_letters(guess, target_word, file_path=MISS_LETTERS_FILE):
     Args:
         guess: the word entered by user as guess.
         target_word: the word of the day chosen at random by the program from a list of valid words.
-        file_path: file created by track_miss_letters() where input letters not in target word are stored.
+        file_path: no longer used, as the letters are kept in memory; accepted so existing callers still work.
 
     Returns:
         a message to user with all letters from their guess that are not in the target word.
@@ -296,22 +490,22 @@ def track_miss_letters(guess, target_word, file_path=MISS_LETTERS_FILE):
     >>> print(track_miss_letters('avail', 'trace'))
     Letters entered not in word of the day: ['I', 'L', 'V']
     >>> delete_miss_letters()
+    >>> print(track_miss_letters("it's!", 'hello'))
+    Letters entered not in word of the day: ['I', 'S', 'T']
+    >>> delete_miss_letters()
+    >>> print(track_miss_letters('straße', 'hello'))
+    Letters entered not in word of the day: ['A', 'R', 'S', 'T']
+    >>> delete_miss_letters()
     """
-    tracked_miss_letters = []
+    global _miss_letters_mask
 
-    file = open(file_path, 'a')
     for letter in guess:
-        if letter not in target_word:
-            file.write(f'{letter}')
-
-    file = open(file_path, 'r')
-    miss_letters = file.read().upper()
+        # only letters A-Z have a bit in the mask; anything else is not tracked
+        if letter not in target_word and letter.isascii() and letter.isalpha():
+            _miss_letters_mask |= 1 << (ord(letter.upper()) - ord('A'))
 
-    for letter in miss_letters:
-        if letter not in tracked_miss_letters:
-            tracked_miss_letters.append(letter)
-
-    tracked_miss_letters.sort()
+    # the bits are in alphabetical order, so the letters come out sorted
+    tracked_miss_letters = [chr(ord('A') + index) for index in range(26) if _miss_letters_mask >> index & 1]
     miss_letters_tracker = f'Letters entered not in word of the day: {tracked_miss_letters}'
 
     return miss_letters_tracker
@@ -319,11 +513,15 @@ def track_miss_letters(guess, target_word, file_path=MISS_LETTERS_FILE):
 
 def delete_miss_letters(file_path=MISS_LETTERS_FILE):
     """
-    Deletes the text file created by track_miss_letters().
+    Forgets the letters tracked by track_miss_letters(), and deletes the text file older versions of the game
+    stored them in.
 
     Args:
-        file_path: file created by track_miss_letters() where input letters not in target word are stored.
+        file_path: file where older versions of track_miss_letters() stored input letters not in target word.
     """
+    global _miss_letters_mask
+
+    _miss_letters_mask = 0
 
     if os.path.exists(file_path):
         os.remove(file_path)
@@ -353,5 +551,4 @@ def main(test=False):
 
 
 if __name__ == '__main__':
-    main(test=False)
-    play()
+    main(test='--test' in sys.argv)